@@ -16,6 +16,7 @@ Main functions:
 - is_pendrive: checks if a drive letter is a USB drive.
 - find_pendrive: returns the letter of the first detected USB drive.
 - should_ignore: determines if a file or directory should be ignored.
+- make_ignore_checks: builds memoized ignore predicates for the hot path.
 - smart_copy_to_pendrive: performs the smart copy operation.
 
 Requirements:
@@ -31,8 +32,12 @@ Example usage:
 """
 
 import os
+import re
 import shutil
+import sys
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 
 try:
     from tqdm import tqdm
@@ -40,30 +45,547 @@ try:
 except ImportError:
     HAS_TQDM = False
 
+# Imported once at module load: the per-call `import win32file` inside
+# is_pendrive cost a module-cache lookup per drive letter probed.
+# Guarded so simulate_main keeps working without pywin32 installed.
+try:
+    import pywintypes
+    import win32api
+    import win32file
+except ImportError:
+    pywintypes = None
+    win32api = None
+    win32file = None
+
+
+def _kernel_supports_uring():
+    # io_uring read/write (and openat) ops are complete from kernel 5.6.
+    try:
+        major, minor = os.uname().release.split('.')[:2]
+        return (int(major), int(minor)) >= (5, 6)
+    except (AttributeError, ValueError, OSError):
+        return False
+
+
+try:
+    import liburing
+    HAS_LIBURING = sys.platform == 'linux' and _kernel_supports_uring()
+except ImportError:
+    liburing = None
+    HAS_LIBURING = False
+
+if sys.platform == 'win32':
+    # IoRing (the Win32 io_uring equivalent) ships with Windows 11;
+    # probing kernelbase for CreateIoRing covers the version check.
+    import ctypes
+    try:
+        _kernelbase = ctypes.WinDLL('kernelbase', use_last_error=True)
+        HAS_IORING = hasattr(_kernelbase, 'CreateIoRing')
+    except OSError:
+        _kernelbase = None
+        HAS_IORING = False
+else:
+    _kernelbase = None
+    HAS_IORING = False
+
 
 def is_pendrive(drive_letter):
     # Simple check for Windows removable drives
-    import win32file
-    drive_type = win32file.GetDriveType(f"{drive_letter}:\\")
-    return drive_type == win32file.DRIVE_REMOVABLE
+    root = f"{drive_letter}:\\"
+    if not os.path.exists(root):
+        # Skip the GetDriveType syscall for letters with no drive.
+        return False
+    return win32file.GetDriveType(root) == win32file.DRIVE_REMOVABLE
 
 
 def find_pendrive():
-    # Returns the first removable drive letter found
-    from string import ascii_uppercase
-    for letter in ascii_uppercase:
-        if is_pendrive(letter):
-            return f"{letter}:\\"
+    # Returns the first removable drive root found. One
+    # GetLogicalDriveStrings call enumerates only the drives that
+    # exist, instead of probing all 26 letters with GetDriveType.
+    for root in win32api.GetLogicalDriveStrings().split('\x00'):
+        if root and win32file.GetDriveType(root) == \
+                win32file.DRIVE_REMOVABLE:
+            return root
     raise RuntimeError("No pendrive detected.")
 
 
-def should_ignore(path, ignore_dirs, ignore_exts, ignore_files):
-    name = os.path.basename(path)
+# Default ignore sets: frozen and interned once at import. frozenset
+# skips the mutable-set write guards, and interned members mean the
+# membership test for a known name is a pointer comparison.
+DEFAULT_IGNORE_DIRS = frozenset(map(sys.intern, (
+    'node_modules', 'venv', '.git', '__pycache__', '.mypy_cache',
+    '.pytest_cache', '.idea', '.next', 'dist', 'build', 'out', '.cache',
+)))
+DEFAULT_IGNORE_EXTS = frozenset(map(sys.intern, (
+    '.exe', '.dll', '.pyc', '.pyo', '.log', '.tmp', '.cache',
+)))
+DEFAULT_IGNORE_FILES = frozenset(map(sys.intern, (
+    'package-lock.json', 'yarn.lock', '.DS_Store', 'Thumbs.db',
+)))
+
+# Shared between main.py and simulate_main.py, so a simulation run
+# warms the cache for the real copy that typically follows it.
+_stat_cache = {}
+
+
+def cached_stat(path, entry=None):
+    """
+    Returns a cached os.stat_result for path. When the DirEntry from
+    _scan is supplied, its already-fetched stat data seeds the cache
+    without issuing any extra syscall.
+    """
+    st = _stat_cache.get(path)
+    if st is None:
+        st = entry.stat() if entry is not None else os.stat(path)
+        _stat_cache[path] = st
+    return st
+
+
+def _scan(top, ignore_dirs):
+    """
+    Recursively scans top with os.scandir, yielding (parent_path, DirEntry)
+    pairs. Reuses the stat data cached on each DirEntry, so no extra
+    stat() syscalls are issued per entry (unlike os.walk + os.path.getsize).
+    Ignored directories are still yielded (so callers can account for them)
+    but are never descended into. Unreadable or concurrently-removed
+    directories are skipped, matching os.walk's default onerror=None.
+    """
+    subdirs = []
+    try:
+        with os.scandir(top) as it:
+            for entry in it:
+                yield top, entry
+                if entry.is_dir(follow_symlinks=False) \
+                        and entry.name not in ignore_dirs:
+                    subdirs.append(entry.path)
+    except OSError:
+        pass
+    for subdir in subdirs:
+        yield from _scan(subdir, ignore_dirs)
+
+
+def should_ignore(name, ignore_dirs, ignore_exts, ignore_files):
+    # Takes the basename directly: every caller already has it
+    # (entry.name from the scandir walk), so no os.path.basename here.
     if name in ignore_dirs or name in ignore_files:
         return True
-    if any(name.endswith(ext) for ext in ignore_exts):
-        return True
-    return False
+    # str.endswith accepts a tuple of suffixes and loops in C.
+    return name.endswith(tuple(ignore_exts))
+
+
+# 1 MiB: large enough to keep a USB target streaming when the userspace
+# fallback loop is taken.
+_COPY_BUFSIZE = 1024 * 1024
+_O_BINARY = getattr(os, 'O_BINARY', 0)  # Windows only; 0 elsewhere
+
+
+def _fast_copy(src, dst):
+    """
+    Copies src to dst, preferring the kernel zero-copy paths:
+    os.copy_file_range (Linux 4.5+), then os.sendfile, then a plain
+    buffered read/write loop. The zero-copy paths move the bytes
+    entirely inside the kernel, never through a Python buffer.
+    Metadata is preserved with shutil.copystat, matching shutil.copy2.
+    """
+    src_fd = os.open(src, os.O_RDONLY | _O_BINARY)
+    try:
+        dst_fd = os.open(
+            dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_BINARY, 0o666)
+        try:
+            size = os.fstat(src_fd).st_size
+            copied = False
+            if hasattr(os, 'copy_file_range'):
+                try:
+                    offset = 0
+                    while offset < size:
+                        sent = os.copy_file_range(
+                            src_fd, dst_fd, size - offset)
+                        if sent == 0:
+                            break
+                        offset += sent
+                    copied = offset >= size
+                except OSError:
+                    copied = False
+            if not copied and hasattr(os, 'sendfile'):
+                try:
+                    os.lseek(dst_fd, 0, os.SEEK_SET)
+                    os.ftruncate(dst_fd, 0)
+                    offset = 0
+                    while offset < size:
+                        sent = os.sendfile(
+                            dst_fd, src_fd, offset, size - offset)
+                        if sent == 0:
+                            break
+                        offset += sent
+                    copied = offset >= size
+                except OSError:
+                    copied = False
+            if not copied:
+                os.lseek(src_fd, 0, os.SEEK_SET)
+                os.lseek(dst_fd, 0, os.SEEK_SET)
+                os.ftruncate(dst_fd, 0)
+                while True:
+                    buf = os.read(src_fd, _COPY_BUFSIZE)
+                    if not buf:
+                        break
+                    while buf:
+                        written = os.write(dst_fd, buf)
+                        buf = buf[written:]
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+    shutil.copystat(src, dst)
+
+
+# 4 MiB chunks keep a USB target streaming sequentially.
+_WIN_COPY_CHUNK = 4 * 1024 * 1024
+
+
+def _win_copy(src, dst):
+    """
+    Windows copy path: the source is opened with
+    FILE_FLAG_SEQUENTIAL_SCAN so the cache manager reads ahead and
+    discards pages behind the copy instead of polluting the standby
+    list, and data moves through a preallocated 4 MiB buffer.
+    Metadata is preserved with shutil.copystat, matching _fast_copy.
+    Failures raise OSError, like the other copy routines: pywin32's
+    own pywintypes.error is not an OSError subclass, so it is
+    translated for the callers that fall back on except OSError.
+    """
+    try:
+        handle = win32file.CreateFile(
+            src, win32file.GENERIC_READ, win32file.FILE_SHARE_READ, None,
+            win32file.OPEN_EXISTING, win32file.FILE_FLAG_SEQUENTIAL_SCAN,
+            None)
+        try:
+            dst_fd = os.open(
+                dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_BINARY,
+                0o666)
+            try:
+                buf = win32file.AllocateReadBuffer(_WIN_COPY_CHUNK)
+                while True:
+                    _, data = win32file.ReadFile(handle, buf)
+                    if not data:
+                        break
+                    view = memoryview(data)
+                    while view:
+                        view = view[os.write(dst_fd, view):]
+            finally:
+                os.close(dst_fd)
+        finally:
+            handle.Close()
+    except pywintypes.error as e:
+        raise OSError(0, e.strerror or str(e), src, e.winerror) from e
+    shutil.copystat(src, dst)
+
+
+# Single-file copy dispatch: the sequential-scan Windows path when
+# pywin32 is present, the zero-copy syscall path otherwise.
+_copy_file = _win_copy if win32file is not None else _fast_copy
+
+
+# io_uring backend tuning: half the ring is filled per batch, and files
+# above the cap take the zero-copy _fast_copy path instead of buffering
+# their whole contents in userspace.
+_URING_QUEUE_DEPTH = 64
+_URING_MAX_FILE = 8 * 1024 * 1024
+
+
+def _uring_drain(ring, count):
+    # Reaps `count` completions, mapping user_data -> res.
+    results = {}
+    cqe = liburing.io_uring_cqe()
+    for _ in range(count):
+        liburing.io_uring_wait_cqe(ring, cqe)
+        results[cqe.user_data] = cqe.res
+        liburing.io_uring_cqe_seen(ring, cqe)
+    return results
+
+
+def _uring_copy(copy_pairs, on_done):
+    """
+    Copies (src, dst) pairs with io_uring: one read SQE per file, a
+    single io_uring_submit per batch, then the matching write SQEs and
+    another single submit. Many files ride on two io_uring_enter
+    syscalls per batch instead of a read/write syscall pair per file.
+    Files larger than _URING_MAX_FILE, and any file whose read or write
+    completes short or with an error, fall back to _fast_copy.
+    Calls on_done(src, dst, error_or_None) per pair.
+    """
+    ring = liburing.io_uring()
+    liburing.io_uring_queue_init(_URING_QUEUE_DEPTH, ring)
+    try:
+        batch_size = _URING_QUEUE_DEPTH // 2
+        for start in range(0, len(copy_pairs), batch_size):
+            jobs = []
+            for src, dst in copy_pairs[start:start + batch_size]:
+                try:
+                    src_fd = os.open(src, os.O_RDONLY)
+                except OSError as e:
+                    on_done(src, dst, e)
+                    continue
+                size = os.fstat(src_fd).st_size
+                if size > _URING_MAX_FILE:
+                    os.close(src_fd)
+                    try:
+                        _copy_file(src, dst)
+                        on_done(src, dst, None)
+                    except OSError as e:
+                        on_done(src, dst, e)
+                    continue
+                try:
+                    dst_fd = os.open(
+                        dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+                except OSError as e:
+                    os.close(src_fd)
+                    on_done(src, dst, e)
+                    continue
+                jobs.append((src, dst, src_fd, dst_fd, bytearray(size)))
+
+            for i, (_, _, src_fd, _, buf) in enumerate(jobs):
+                sqe = liburing.io_uring_get_sqe(ring)
+                liburing.io_uring_prep_read(sqe, src_fd, buf, len(buf), 0)
+                sqe.user_data = i
+            liburing.io_uring_submit(ring)
+            read_res = _uring_drain(ring, len(jobs))
+
+            writable = []
+            for i, job in enumerate(jobs):
+                if read_res.get(i) == len(job[4]):
+                    writable.append((i, job))
+                else:
+                    os.close(job[2])
+                    os.close(job[3])
+                    try:
+                        _copy_file(job[0], job[1])
+                        on_done(job[0], job[1], None)
+                    except OSError as e:
+                        on_done(job[0], job[1], e)
+
+            for i, (_, _, _, dst_fd, buf) in writable:
+                sqe = liburing.io_uring_get_sqe(ring)
+                liburing.io_uring_prep_write(sqe, dst_fd, buf, len(buf), 0)
+                sqe.user_data = i
+            liburing.io_uring_submit(ring)
+            write_res = _uring_drain(ring, len(writable))
+
+            for i, (src, dst, src_fd, dst_fd, buf) in writable:
+                os.close(src_fd)
+                os.close(dst_fd)
+                res = write_res.get(i)
+                if res == len(buf):
+                    shutil.copystat(src, dst)
+                    on_done(src, dst, None)
+                else:
+                    try:
+                        _copy_file(src, dst)
+                        on_done(src, dst, None)
+                    except OSError as e:
+                        on_done(src, dst, e)
+    finally:
+        liburing.io_uring_queue_exit(ring)
+
+
+if HAS_IORING:
+    # Minimal ctypes mirror of ioringapi.h, just enough for batched
+    # reads: CreateIoRing / BuildIoRingReadFile / SubmitIoRing /
+    # PopIoRingCompletion / CloseIoRing.
+    class _IORING_CREATE_FLAGS(ctypes.Structure):
+        _fields_ = [('Required', ctypes.c_uint32),
+                    ('Advisory', ctypes.c_uint32)]
+
+    class _IORING_HANDLE_REF(ctypes.Structure):
+        _fields_ = [('Kind', ctypes.c_uint32),
+                    ('Handle', ctypes.c_void_p)]
+
+    class _IORING_BUFFER_REF(ctypes.Structure):
+        _fields_ = [('Kind', ctypes.c_uint32),
+                    ('Address', ctypes.c_void_p)]
+
+    class _IORING_CQE(ctypes.Structure):
+        _fields_ = [('UserData', ctypes.c_size_t),
+                    ('ResultCode', ctypes.c_int32),
+                    ('Information', ctypes.c_size_t)]
+
+    _IORING_VERSION_1 = 1
+
+
+def _ioring_copy(copy_pairs, on_done):
+    """
+    Copies (src, dst) pairs on Windows 11 using IoRing: read requests
+    for a whole batch of files are queued and submitted with a single
+    SubmitIoRing call, then the buffers are written out and metadata
+    copied. Large files, short reads and per-operation errors fall back
+    to _fast_copy. Calls on_done(src, dst, error_or_None) per pair.
+    """
+    import msvcrt
+    hring = ctypes.c_void_p()
+    flags = _IORING_CREATE_FLAGS(0, 0)
+    if _kernelbase.CreateIoRing(
+            _IORING_VERSION_1, flags, _URING_QUEUE_DEPTH,
+            _URING_QUEUE_DEPTH * 2, ctypes.byref(hring)) != 0:
+        # Ring creation failed: degrade to the plain per-file path.
+        for src, dst in copy_pairs:
+            try:
+                _copy_file(src, dst)
+                on_done(src, dst, None)
+            except OSError as e:
+                on_done(src, dst, e)
+        return
+    try:
+        batch_size = _URING_QUEUE_DEPTH // 2
+        for start in range(0, len(copy_pairs), batch_size):
+            jobs = []
+            for src, dst in copy_pairs[start:start + batch_size]:
+                try:
+                    src_fd = os.open(src, os.O_RDONLY | _O_BINARY)
+                except OSError as e:
+                    on_done(src, dst, e)
+                    continue
+                size = os.fstat(src_fd).st_size
+                if size > _URING_MAX_FILE:
+                    os.close(src_fd)
+                    try:
+                        _copy_file(src, dst)
+                        on_done(src, dst, None)
+                    except OSError as e:
+                        on_done(src, dst, e)
+                    continue
+                jobs.append((src, dst, src_fd, bytearray(size)))
+
+            queued = []
+            for i, (src, dst, src_fd, buf) in enumerate(jobs):
+                handle = msvcrt.get_osfhandle(src_fd)
+                href = _IORING_HANDLE_REF(0, handle)  # raw handle kind
+                cbuf = (ctypes.c_char * len(buf)).from_buffer(buf) \
+                    if buf else None
+                bref = _IORING_BUFFER_REF(
+                    0, ctypes.cast(cbuf, ctypes.c_void_p) if cbuf else None)
+                hr = _kernelbase.BuildIoRingReadFile(
+                    hring, href, bref, len(buf),
+                    ctypes.c_uint64(0), ctypes.c_size_t(i), 0)
+                if hr == 0:
+                    queued.append(i)
+                # A failed build falls through to the short-read check.
+
+            submitted = ctypes.c_uint32(0)
+            _kernelbase.SubmitIoRing(
+                hring, len(queued), 0xFFFFFFFF, ctypes.byref(submitted))
+            read_ok = set()
+            cqe = _IORING_CQE()
+            while _kernelbase.PopIoRingCompletion(
+                    hring, ctypes.byref(cqe)) == 0:
+                i = cqe.UserData
+                if cqe.ResultCode == 0 \
+                        and cqe.Information == len(jobs[i][3]):
+                    read_ok.add(i)
+
+            for i, (src, dst, src_fd, buf) in enumerate(jobs):
+                os.close(src_fd)
+                if i not in read_ok:
+                    try:
+                        _copy_file(src, dst)
+                        on_done(src, dst, None)
+                    except OSError as e:
+                        on_done(src, dst, e)
+                    continue
+                try:
+                    dst_fd = os.open(
+                        dst,
+                        os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_BINARY,
+                        0o666)
+                    try:
+                        view = memoryview(buf)
+                        while view:
+                            view = view[os.write(dst_fd, view):]
+                    finally:
+                        os.close(dst_fd)
+                    shutil.copystat(src, dst)
+                    on_done(src, dst, None)
+                except OSError as e:
+                    on_done(src, dst, e)
+    finally:
+        _kernelbase.CloseIoRing(hring)
+
+
+def make_ignore_checks(ignore_dirs, ignore_exts, ignore_files):
+    """
+    Builds (should_ignore_dir, should_ignore_file) predicates over the
+    given ignore sets. Both are memoized with lru_cache: directory and
+    file names repeat heavily across a project tree (e.g. __init__.py,
+    src, tests), so repeated lookups hit the cache instead of re-running
+    the membership and suffix checks per entry.
+    """
+    ignore_dirs = frozenset(ignore_dirs)
+
+    # Exact names and extension suffixes compiled into one pattern: a
+    # single C-level regex scan replaces the set probe plus suffix
+    # check per file. Directory names stay set-based -- they are exact
+    # matches, where the frozenset probe is already one hash lookup.
+    branches = []
+    if ignore_files:
+        branches.append(
+            r'\A(?:' + '|'.join(map(re.escape, sorted(ignore_files))) + ')')
+    if ignore_exts:
+        branches.append(
+            '(?:' + '|'.join(map(re.escape, sorted(ignore_exts))) + ')')
+    ignore_file_re = re.compile(
+        '(?:' + '|'.join(branches) + r')\Z') if branches else None
+
+    @lru_cache(maxsize=4096)
+    def should_ignore_dir(name):
+        # scandir hands back fresh str objects; interning makes the
+        # set probe a pointer comparison against the interned members.
+        return sys.intern(name) in ignore_dirs
+
+    @lru_cache(maxsize=4096)
+    def should_ignore_file(name):
+        if ignore_file_re is None:
+            return False
+        return ignore_file_re.search(name) is not None
+
+    return should_ignore_dir, should_ignore_file
+
+
+def _iter_copy_pairs_py(src_folder, dest_folder, ignore_dirs, ignore_exts,
+                        ignore_files):
+    """
+    Yields (src_path, dest_path, is_dir, stat_result) for every entry
+    under src_folder that survives the ignore rules. Directories come
+    before their contents (stat_result is None for them); ignored
+    directories are never descended into. Symlinked files are yielded
+    (their targets get copied), but the walk never follows a link into
+    a directory. Unreadable or concurrently-removed directories are
+    skipped, matching os.walk's default onerror=None. Pure-Python
+    fallback for the compiled _walker.iter_copy_pairs.
+    """
+    should_ignore_dir, should_ignore_file = make_ignore_checks(
+        ignore_dirs, ignore_exts, ignore_files)
+    stack = [(src_folder, dest_folder)]
+    while stack:
+        top, dest = stack.pop()
+        dest_prefix = dest + os.sep
+        try:
+            with os.scandir(top) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not should_ignore_dir(entry.name):
+                            dst = dest_prefix + entry.name
+                            yield entry.path, dst, True, None
+                            stack.append((entry.path, dst))
+                    elif entry.is_file():
+                        if not should_ignore_file(entry.name):
+                            yield (entry.path, dest_prefix + entry.name,
+                                   False, entry.stat())
+        except OSError:
+            continue
+
+
+try:
+    from _walker import iter_copy_pairs
+except ImportError:
+    iter_copy_pairs = _iter_copy_pairs_py
 
 
 def smart_copy_to_pendrive(
@@ -71,7 +593,10 @@ def smart_copy_to_pendrive(
     ignore_dirs=None,
     ignore_exts=None,
     ignore_files=None,
-    dry_run=False
+    dry_run=False,
+    max_workers=8,
+    backend='auto',
+    incremental=True
 ):
     """
     Copies files from src_folder to the first detected pendrive,
@@ -82,64 +607,111 @@ def smart_copy_to_pendrive(
         ignore_exts (set): File extensions to ignore.
         ignore_files (set): File names to ignore.
         dry_run (bool): If True, only print what would be copied.
+        max_workers (int): Copy threads to run in parallel (the GIL is
+            released during the underlying read/write syscalls, so
+            copies to a slow USB target overlap).
+        backend (str): 'auto' picks the best available copy backend
+            (Windows IoRing, then Linux io_uring, then threads);
+            'ioring', 'uring' or 'threads' force one.
+        incremental (bool): If True (default), skip files whose
+            destination already matches on size and mtime, so repeated
+            syncs to the same drive only move what changed.
     """
     if ignore_dirs is None:
-        ignore_dirs = {
-            'node_modules', 'venv', '.git', '__pycache__', '.mypy_cache',
-            '.pytest_cache', '.idea', '.next', 'dist', 'build', 'out', '.cache'
-        }
+        ignore_dirs = DEFAULT_IGNORE_DIRS
     if ignore_exts is None:
-        ignore_exts = {
-            '.exe', '.dll', '.pyc', '.pyo', '.log', '.tmp', '.cache'
-        }
+        ignore_exts = DEFAULT_IGNORE_EXTS
     if ignore_files is None:
-        ignore_files = {
-            'package-lock.json', 'yarn.lock', '.DS_Store', 'Thumbs.db'
-        }
+        ignore_files = DEFAULT_IGNORE_FILES
 
     logging.basicConfig(level=logging.INFO, format='%(message)s')
     pendrive_root = find_pendrive()
     dest_folder = os.path.join(pendrive_root, os.path.basename(src_folder))
 
-    # Count total files for progress bar
-    total_files = 0
-    for root, dirs, files in os.walk(src_folder):
-        dirs[:] = [d for d in dirs if not should_ignore(
-            d, ignore_dirs, set(), set())]
-        for file in files:
-            if not should_ignore(file, set(), ignore_exts, ignore_files):
-                total_files += 1
-
-    iterator = os.walk(src_folder)
-    if HAS_TQDM and not dry_run:
-        pbar = tqdm(total=total_files, desc="Copying files", unit="file")
+    # Single walk (compiled when the _walker extension is built):
+    # destination directories are created up front, so the copy threads
+    # never race on makedirs, and the copy pairs are collected.
+    copy_pairs = []
+    if not dry_run:
+        os.makedirs(dest_folder, exist_ok=True)
+    for src_file, dest_file, is_dir, src_st in iter_copy_pairs(
+            src_folder, dest_folder, frozenset(ignore_dirs),
+            tuple(ignore_exts), frozenset(ignore_files)):
+        if is_dir:
+            if not dry_run:
+                os.makedirs(dest_file, exist_ok=True)
+            continue
+        if incremental:
+            try:
+                dst_st = os.stat(dest_file)
+            except OSError:
+                dst_st = None
+            # 2s mtime tolerance: FAT32 stores timestamps with 2-second
+            # resolution, and that is what most pendrives use.
+            if dst_st is not None \
+                    and dst_st.st_size == src_st.st_size \
+                    and abs(dst_st.st_mtime - src_st.st_mtime) < 2:
+                logging.info(f"Skipped (up-to-date): {dest_file}")
+                continue
+        if dry_run:
+            logging.info(f"Would copy: {src_file} -> {dest_file}")
+        else:
+            copy_pairs.append((src_file, dest_file))
+
+    if dry_run:
+        return
+
+    # The single walk already materialized copy_pairs, so the total
+    # comes for free -- no precount traversal of the tree needed.
+    if HAS_TQDM:
+        pbar = tqdm(total=len(copy_pairs), desc="Copying files",
+                    unit="file")
     else:
         pbar = None
 
-    for root, dirs, files in iterator:
-        dirs[:] = [d for d in dirs if not should_ignore(
-            d, ignore_dirs, set(), set())]
-        rel_path = os.path.relpath(root, src_folder)
-        dest_path = os.path.join(dest_folder, rel_path)
-        if not dry_run:
-            os.makedirs(dest_path, exist_ok=True)
-        for file in files:
-            if should_ignore(file, set(), ignore_exts, ignore_files):
-                continue
-            src_file = os.path.join(root, file)
-            dest_file = os.path.join(dest_path, file)
-            if dry_run:
-                logging.info(f"Would copy: {src_file} -> {dest_file}")
-            else:
+    def finish(src_file, dest_file, error):
+        if error is None:
+            # The destination's cached stat (if any) is stale now.
+            _stat_cache.pop(dest_file, None)
+            logging.info(f"Copied: {src_file} -> {dest_file}")
+        else:
+            logging.error(
+                f"Failed to copy {src_file} to {dest_file}: {error}"
+            )
+        if pbar:
+            pbar.update(1)
+
+    if backend == 'auto':
+        if HAS_IORING:
+            backend = 'ioring'
+        elif HAS_LIBURING:
+            backend = 'uring'
+        else:
+            backend = 'threads'
+    if backend == 'ioring':
+        if not HAS_IORING:
+            raise RuntimeError("IoRing backend requires Windows 11.")
+        _ioring_copy(copy_pairs, finish)
+    elif backend == 'uring':
+        if not HAS_LIBURING:
+            raise RuntimeError(
+                "io_uring backend requires Linux >= 5.6 and liburing.")
+        _uring_copy(copy_pairs, finish)
+    elif backend == 'threads':
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(_copy_file, src, dst): (src, dst)
+                for src, dst in copy_pairs
+            }
+            for future in as_completed(futures):
+                src_file, dest_file = futures[future]
                 try:
-                    shutil.copy2(src_file, dest_file)
-                    logging.info(f"Copied: {src_file} -> {dest_file}")
+                    future.result()
+                    finish(src_file, dest_file, None)
                 except Exception as e:
-                    logging.error(
-                        f"Failed to copy {src_file} to {dest_file}: {e}"
-                    )
-            if pbar:
-                pbar.update(1)
+                    finish(src_file, dest_file, e)
+    else:
+        raise ValueError(f"Unknown backend: {backend!r}")
     if pbar:
         pbar.close()
 
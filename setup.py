@@ -0,0 +1,21 @@
+"""
+Optional build script for the compiled _walker extension.
+
+    python setup.py build_ext --inplace
+
+Cython is not required to use the tool: main.py falls back to a
+pure-Python walker when the extension is missing.
+"""
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+    ext_modules = cythonize("_walker.pyx", language_level=3)
+except ImportError:
+    ext_modules = []
+
+setup(
+    name="folder-to-usb",
+    py_modules=["main", "simulate_main"],
+    ext_modules=ext_modules,
+)
@@ -25,7 +25,10 @@ Requirements:
 """
 
 import os
-from main import should_ignore
+from main import (
+    DEFAULT_IGNORE_DIRS, DEFAULT_IGNORE_EXTS, DEFAULT_IGNORE_FILES,
+    cached_stat, make_ignore_checks, _scan,
+)
 
 if __name__ == "__main__":
     # Set your test folder here (example):
@@ -33,96 +36,133 @@ if __name__ == "__main__":
     output_path = "simulated_copy_log.txt"
     total_copy_size = 0
     total_ignored_size = 0
-    from collections import defaultdict
-    copied_ext_stats = defaultdict(lambda: {'count': 0, 'size': 0})
-    ignored_ext_stats = defaultdict(lambda: {'count': 0, 'size': 0})
-    default_dirs = {
-        'node_modules', 'venv', '.git', '__pycache__', '.mypy_cache',
-        '.pytest_cache', '.idea', '.next', 'dist', 'build', 'out', '.cache'
-    }
-    default_exts = {
-        '.exe', '.dll', '.pyc', '.pyo', '.log', '.tmp', '.cache'
-    }
-    default_files = {
-        'package-lock.json', 'yarn.lock', '.DS_Store', 'Thumbs.db'
-    }
+    from collections import Counter
+    # Separate count/size Counters: no per-extension dict allocation,
+    # and the += path is handled by Counter's C-backed dict machinery.
+    copied_count = Counter()
+    copied_size = Counter()
+    ignored_count = Counter()
+    ignored_size = Counter()
+    # Same frozen, interned sets the real copy uses.
+    default_dirs = DEFAULT_IGNORE_DIRS
+    default_exts = DEFAULT_IGNORE_EXTS
+    default_files = DEFAULT_IGNORE_FILES
+    should_ignore_dir, should_ignore_file = make_ignore_checks(
+        default_dirs, default_exts, default_files)
 
     def add_dir_ignored_stats(dir_path):
-        for root, _, files in os.walk(dir_path):
-            for file in files:
-                src_file = os.path.join(root, file)
-                try:
-                    file_size = os.path.getsize(src_file)
-                except Exception:
-                    continue
-                ext = os.path.splitext(file)[1].lower()
-                global total_ignored_size
-                total_ignored_size += file_size
-                ignored_ext_stats[ext]['count'] += 1
-                ignored_ext_stats[ext]['size'] += file_size
+        for root, entry in _scan(dir_path, set()):
+            # Plain is_file(): symlinked files count too, as they did
+            # under os.walk; only the recursion refuses to follow links.
+            if not entry.is_file():
+                continue
+            try:
+                file_size = cached_stat(entry.path, entry).st_size
+            except Exception:
+                continue
+            name = entry.name
+            dot = name.rfind('.')
+            ext = name[dot:].lower() if dot > 0 else ''
+            global total_ignored_size
+            total_ignored_size += file_size
+            ignored_count[ext] += 1
+            ignored_size[ext] += file_size
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write("# Simulated Copy Log\n\n")
+    # Binary mode with a 1 MiB buffer: pre-encoded bytes skip the
+    # per-write encode + newline translation of a text-mode file, and
+    # lines are batched per directory below to cut write calls further.
+    with open(output_path, "wb", buffering=1 << 20) as f:
+        f.write(b"# Simulated Copy Log\n\n")
         # Write the default ignore lists for documentation
-        f.write("## Ignored Directories\n")
+        f.write(b"## Ignored Directories\n")
         for d in default_dirs:
-            f.write(f"- {d}\n")
-        f.write("\n## Ignored Extensions\n")
+            f.write(f"- {d}\n".encode())
+        f.write(b"\n## Ignored Extensions\n")
         for e in default_exts:
-            f.write(f"- {e}\n")
-        f.write("\n## Ignored Files\n")
+            f.write(f"- {e}\n".encode())
+        f.write(b"\n## Ignored Files\n")
         for n in default_files:
-            f.write(f"- {n}\n")
-        f.write("\n## Files That Would Be Copied\n\n")
-        for root, dirs, files in os.walk(test_folder):
-            # Handle ignored directories: remove from walk, but sum their stats
-            ignored_dirs = [
-                d for d in dirs if should_ignore(d, default_dirs, set(), set())
-            ]
-            for ignored in ignored_dirs:
-                add_dir_ignored_stats(os.path.join(root, ignored))
-            dirs[:] = [d for d in dirs if d not in ignored_dirs]
-            rel_path = os.path.relpath(root, test_folder)
-            for file in files:
-                src_file = os.path.join(root, file)
-                try:
-                    file_size = os.path.getsize(src_file)
-                except Exception:
-                    continue
-                ext = os.path.splitext(file)[1].lower()
-                if should_ignore(file, set(), default_exts, default_files):
-                    total_ignored_size += file_size
-                    ignored_ext_stats[ext]['count'] += 1
-                    ignored_ext_stats[ext]['size'] += file_size
-                    continue
-                dest_file = os.path.join("SIMULATED_USB", rel_path, file)
-                f.write(f"Would copy: {src_file} -> {dest_file}\n")
-                total_copy_size += file_size
-                copied_ext_stats[ext]['count'] += 1
-                copied_ext_stats[ext]['size'] += file_size
-        f.write("\n## Summary\n")
+            f.write(f"- {n}\n".encode())
+        f.write(b"\n## Files That Would Be Copied\n\n")
+        lines = []
+        join = os.path.join  # local binding: LOAD_FAST in the hot loop
+        # Destination prefix is rebuilt only when the walk enters a new
+        # directory; per file it is a plain string concatenation. Since
+        # the walk descends from test_folder, the relative path is an
+        # O(1) slice rather than an os.path.relpath call.
+        src_prefix_len = len(test_folder.rstrip(os.sep)) + 1
+        last_root = None
+        dest_prefix = None
+        for root, entry in _scan(test_folder, default_dirs):
+            if root != last_root:
+                last_root = root
+                rel_path = root[src_prefix_len:] \
+                    if len(root) > src_prefix_len else ''
+                dest_prefix = join("SIMULATED_USB", rel_path, '')
+                if lines:
+                    f.writelines(lines)
+                    lines.clear()
+            # Ignored directories are yielded but never descended into:
+            # sum their stats here before moving on.
+            if entry.is_dir(follow_symlinks=False):
+                if should_ignore_dir(entry.name):
+                    add_dir_ignored_stats(entry.path)
+                continue
+            if not entry.is_file():
+                continue
+            file = entry.name
+            src_file = entry.path
+            try:
+                file_size = cached_stat(src_file, entry).st_size
+            except Exception:
+                continue
+            # str.rfind is a single C call versus splitext's
+            # Python-level path logic.
+            dot = file.rfind('.')
+            ext = file[dot:].lower() if dot > 0 else ''
+            if should_ignore_file(file):
+                total_ignored_size += file_size
+                ignored_count[ext] += 1
+                ignored_size[ext] += file_size
+                continue
+            dest_file = dest_prefix + file
+            lines.append(
+                b"Would copy: " + src_file.encode()
+                + b" -> " + dest_file.encode() + b"\n"
+            )
+            total_copy_size += file_size
+            copied_count[ext] += 1
+            copied_size[ext] += file_size
+        if lines:
+            f.writelines(lines)
+            lines.clear()
+        f.write(b"\n## Summary\n")
         f.write(
             f"Total size to copy: "
-            f"{total_copy_size / (1024*1024):.2f} MB\n"
+            f"{total_copy_size / (1024*1024):.2f} MB\n".encode()
         )
         f.write(
             f"Total size ignored: "
-            f"{total_ignored_size / (1024*1024):.2f} MB\n"
+            f"{total_ignored_size / (1024*1024):.2f} MB\n".encode()
         )
         # New: Extension summary tables
 
-        def write_ext_table(title, stats):
-            f.write(f"\n### {title}\n")
-            f.write(f"{'Extension':<12}{'Count':>10}{'Size (MB)':>15}\n")
-            f.write(f"{'-'*37}\n")
-            for ext, data in sorted(
-                stats.items(), key=lambda x: (-x[1]['size'], x[0])
-            ):
-                f.write(
-                    f"{ext or '[no ext]':<12}"
-                    f"{data['count']:>10}"
-                    f"{data['size']/(1024*1024):>15.2f}\n"
+        def write_ext_table(title, count_stats, size_stats):
+            f.write(f"\n### {title}\n".encode())
+            f.write(
+                f"{'Extension':<12}{'Count':>10}{'Size (MB)':>15}\n".encode()
+            )
+            f.write(f"{'-'*37}\n".encode())
+            # Rows built in one comprehension and flushed with a single
+            # writelines call, instead of one f.write per row.
+            f.writelines([
+                (f"{ext or '[no ext]':<12}"
+                 f"{count_stats[ext]:>10}"
+                 f"{size/(1024*1024):>15.2f}\n").encode()
+                for ext, size in sorted(
+                    size_stats.items(), key=lambda x: (-x[1], x[0])
                 )
+            ])
 
-        write_ext_table("Copied Extensions", copied_ext_stats)
-        write_ext_table("Ignored Extensions", ignored_ext_stats)
+        write_ext_table("Copied Extensions", copied_count, copied_size)
+        write_ext_table("Ignored Extensions", ignored_count, ignored_size)